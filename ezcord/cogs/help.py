@@ -124,7 +124,7 @@ class Help(Cog, hidden=True):
         # check language file for embed localization
         locale = I18N.get_locale(ctx)
         try:
-            embed_overrides = I18N.localizations[locale]["help"]["embed"]
+            embed_overrides = I18N.get_localizations(locale)["help"]["embed"]
         except (KeyError, AttributeError):
             # KeyError: language file for this locale does not have a help/embed section
             # AttributeError: I18N class is not in use
@@ -3,9 +3,10 @@ from __future__ import annotations
 import inspect
 import random
 import re
-from copy import deepcopy
+import sys
+from collections import ChainMap
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Literal, Union
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Literal, Mapping, Union
 
 from .internal.dc import PYCORD, discord
 from .logs import log
@@ -54,6 +55,28 @@ if TYPE_CHECKING:
 
 __all__ = ("t", "TEmbed", "I18N", "LOCALE")
 
+# Separate random instance for list values, so that the global random state is not shared
+_RNG = random.Random()
+
+_VARIABLE_PATTERN = re.compile(r"{(\w+)}")
+_GENERAL_VARIABLE_PATTERN = re.compile(r"{(\.)?([^{}]*)}")  # {.local} or {global}
+_TEMPLATE_CACHE: dict[str, tuple[str, ...]] = {}
+_TEMPLATE_CACHE_SIZE = 4096  # limit for strings that are not part of the language file
+_LANGUAGE_TEMPLATES: dict[str, tuple[str, ...]] = {}  # compiled when loading the language file
+_INTERN_MAX_LENGTH = 100  # strings of the language file up to this length are interned
+_TEXT_CACHE: dict[tuple, str] = {}
+_TEXT_CACHE_SIZE = 4096
+_CACHEABLE_TYPES = (str, int, float, bool, type(None))  # variables with a stable string value
+_PARAMS_CACHE: dict[Callable, frozenset[str]] = {}  # parameter names per function
+_STANDARD_UI = (discord.ui.Select, discord.ui.Button)
+_VIEW_ITEM_ATTRIBUTES: dict[type, tuple[str, ...]] = {}  # localized attributes per item type
+_MESSAGE_TYPES = (discord.abc.Messageable, discord.Message)
+_DISCORD_MISSING = discord.utils.MISSING  # default value of optional parameters
+
+# internal files that are ignored to determine the origin method in get_location
+_SKIP_FILES = frozenset(("i18n", "emb", "interactions"))
+_FILE_STEMS: dict[str, str] = {}  # file names of the code objects in get_location
+
 
 def t(obj: LOCALE | str, key: str, count: int | None = None, **variables):
     """Get the localized string for the given key and insert all variables.
@@ -93,64 +116,112 @@ class TEmbed(discord.Embed):
         self.class_name = class_
 
 
+def _intern(string: str) -> str:
+    """Intern a string. str subclasses (e.g. from ruamel.yaml) can't be interned."""
+    return sys.intern(string) if type(string) is str else string
+
+
+def _compile_template(string: str) -> tuple[str, ...]:
+    """Split a string into literals and variable names. Literals are at even indices,
+    variable names at odd indices. The result is cached per string.
+    """
+    template = _TEMPLATE_CACHE.get(string)
+    if template is None:
+        if len(_TEMPLATE_CACHE) >= _TEMPLATE_CACHE_SIZE + len(_LANGUAGE_TEMPLATES):
+            # only keep the templates from the language file
+            _TEMPLATE_CACHE.clear()
+            _TEMPLATE_CACHE.update(_LANGUAGE_TEMPLATES)
+        template = _TEMPLATE_CACHE[string] = tuple(_VARIABLE_PATTERN.split(string))
+    return template
+
+
 def _extract_parameters(func, **kwargs):
     """Extract all kwargs that are not part of the function signature and returns them as
     a dictionary of variables.
     """
-    params = inspect.signature(func).parameters
-    variables = {key: kwargs.pop(key) for key, value in kwargs.copy().items() if key not in params}
+    params = _PARAMS_CACHE.get(func)
+    if params is None:
+        params = _PARAMS_CACHE[func] = frozenset(inspect.signature(func).parameters)
+
+    variables = {key: kwargs.pop(key) for key in list(kwargs) if key not in params}
     return variables, kwargs
 
 
-def _check_embed(locale: str, count: int | None, variables: dict, **kwargs):
-    """Check if the kwargs contain an embed. Returns the updated kwargs.
+def _format_number(value: int, locale: str) -> int | str:
+    """Add thousands separators to a number, unless it is a Discord ID that
+    should be ignored.
+    """
+    # Discord IDs have at least 17 digits
+    if I18N.ignore_discord_ids and (value >= 10**16 or value <= -(10**15)):
+        return value
+
+    formatted = format(value, ",")
+    return formatted.replace(",", ".") if locale == "de" else formatted
+
+
+def _format_variables(locale: str, variables: dict) -> dict:
+    """Format all numbers of the given variables once, so that they don't need to be formatted
+    again for every string of a message. The count is kept as a number for pluralization.
+    """
+    if not I18N.localize_numbers:
+        return variables
+
+    return {
+        key: (_format_number(value, locale) if type(value) is int and key != "count" else value)
+        for key, value in variables.items()
+    }
+
+
+def _check_embeds(locale: str, count: int | None, variables: dict, **kwargs):
+    """Check if the kwargs contain an embed or an embed list. Returns the updated kwargs.
 
     - Embed is a TEmbed: Load the embed from the language file.
     - Embed is a default Embed: Load all keys inside the embed from the language file
     """
 
-    add_locations: tuple = ()
-    embed = kwargs.get("embed")
-    if isinstance(embed, TEmbed):
-        variables = {**variables, **embed.variables}
-        add_locations = (embed.method_name, embed.class_name)
-        embed = I18N.load_embed(embed, locale)
+    location = None
+    for kwarg in ("embed", "embeds"):
+        embeds = kwargs.get(kwarg)
+        # Skip missing values and default parameters that were passed on. This is not a
+        # truthiness check, as embeds without content (e.g. TEmbed()) are falsy.
+        if embeds is None or embeds is _DISCORD_MISSING:
+            continue
 
-    if embed:
-        if "count" in variables:
-            count = variables["count"]
-        new_embed_dict = I18N.load_lang_keys(
-            embed.to_dict(), locale, count, add_locations, **variables
-        )
-        kwargs["embed"] = discord.Embed.from_dict(new_embed_dict)
+        if location is None:
+            location = I18N.get_location()
+
+        if kwarg == "embed":
+            kwargs[kwarg] = _localize_embed(embeds, locale, count, variables, location)
+        else:
+            kwargs[kwarg] = [
+                _localize_embed(embed, locale, count, variables, location) for embed in embeds
+            ]
 
     return kwargs
 
 
-def _check_embeds(locale: str, count: int | None, variables: dict, **kwargs):
-    """Check if the kwargs contain an embed list. Returns the updated kwargs."""
+def _localize_embed(
+    embed: discord.Embed, locale: str, count: int | None, variables: dict, location: tuple
+) -> discord.Embed:
+    """Load all keys inside a single embed from the language file."""
 
     add_locations: tuple = ()
-    embeds = kwargs.get("embeds")
-    if not embeds:
-        return kwargs
-
-    new_embeds = []
-    for embed in embeds:
-        if isinstance(embed, TEmbed):
+    if isinstance(embed, TEmbed):
+        if embed.variables:
             variables = {**variables, **embed.variables}
-            add_locations = (embed.method_name, embed.class_name)
-            embed = I18N.load_embed(embed, locale)
+        add_locations = (embed.method_name, embed.class_name)
+        embed = I18N._load_embed(embed, locale, location)
 
-        if "count" in variables:
-            count = variables["count"]
-        new_embed_dict = I18N.load_lang_keys(
-            embed.to_dict(), locale, count, add_locations, **variables
-        )
-        new_embeds.append(discord.Embed.from_dict(new_embed_dict))
+    if "count" in variables:
+        count = variables["count"]
+    embed_dict = embed.to_dict()
+    new_embed_dict = I18N._load_lang_keys(
+        embed_dict, locale, count, add_locations, location, variables
+    )
+    if new_embed_dict == embed_dict:
+        return embed  # no keys or variables found
 
-    kwargs["embeds"] = new_embeds
-    return kwargs
+    return discord.Embed.from_dict(new_embed_dict)
 
 
 def _check_view(locale: str, count: int | None, variables: dict, **kwargs):
@@ -160,29 +231,38 @@ def _check_view(locale: str, count: int | None, variables: dict, **kwargs):
         count = variables["count"]
 
     view = kwargs.get("view")
-    if view:
-        class_name = view.__class__.__name__
+    if view and view.children:
+        location = I18N.get_location()
+        view_name = view.__class__.__name__
         for child in view.children:
-            if type(child) not in [discord.ui.Select, discord.ui.Button]:
+            child_type = type(child)
+            if child_type in _STANDARD_UI:
+                class_name = view_name
+            else:
                 # if a child element of the view has its own subclass, search for this class name
                 # in the language file instead of the view name
-                class_name = child.__class__.__name__
+                class_name = child_type.__name__
 
-            if hasattr(child, "label"):
-                child.label = I18N.load_text(child.label, locale, count, class_name, **variables)
+            attributes = _VIEW_ITEM_ATTRIBUTES.get(child_type)
+            if attributes is None:
+                attributes = _VIEW_ITEM_ATTRIBUTES[child_type] = tuple(
+                    attr for attr in ("label", "placeholder") if hasattr(child, attr)
+                )
 
-            if hasattr(child, "placeholder"):
-                child.placeholder = I18N.load_text(
-                    child.placeholder, locale, count, class_name, **variables
+            for attr in attributes:
+                text = I18N._load_text(
+                    getattr(child, attr), locale, count, class_name, (), location, variables
                 )
+                setattr(child, attr, text)
 
-            if hasattr(child, "options"):
-                for option in child.options:
-                    option.label = I18N.load_text(
-                        option.label, locale, count, class_name, **variables
+            options = getattr(child, "options", None)
+            if options:
+                for option in options:
+                    option.label = I18N._load_text(
+                        option.label, locale, count, class_name, (), location, variables
                     )
-                    option.description = I18N.load_text(
-                        option.description, locale, count, class_name, **variables
+                    option.description = I18N._load_text(
+                        option.description, locale, count, class_name, (), location, variables
                     )
 
     return kwargs
@@ -224,13 +304,15 @@ def _localize_send(send_func):
 
         locale = I18N.get_locale(use_locale or self)
         variables, kwargs = _extract_parameters(send_func, **kwargs)
+        variables = _format_variables(locale, variables)
 
         # Check content
         content = I18N.load_text(content, locale, **variables)
 
-        kwargs = _check_embed(locale, count, variables, **kwargs)
-        kwargs = _check_embeds(locale, count, variables, **kwargs)
-        kwargs = _check_view(locale, count, variables, **kwargs)
+        if "embed" in kwargs or "embeds" in kwargs:
+            kwargs = _check_embeds(locale, count, variables, **kwargs)
+        if "view" in kwargs:
+            kwargs = _check_view(locale, count, variables, **kwargs)
 
         return await send_func(self, content, **kwargs)
 
@@ -254,6 +336,7 @@ def _localize_edit(edit_func):
         """
         locale = I18N.get_locale(use_locale or self)
         variables, kwargs = _extract_parameters(edit_func, **kwargs)
+        variables = _format_variables(locale, variables)
 
         # Check content (must be a kwarg)
         content = kwargs.get("content")
@@ -261,9 +344,10 @@ def _localize_edit(edit_func):
             new_content = I18N.load_text(content, locale, count, **variables)
             kwargs["content"] = new_content
 
-        kwargs = _check_embed(locale, count, variables, **kwargs)
-        kwargs = _check_embeds(locale, count, variables, **kwargs)
-        kwargs = _check_view(locale, count, variables, **kwargs)
+        if "embed" in kwargs or "embeds" in kwargs:
+            kwargs = _check_embeds(locale, count, variables, **kwargs)
+        if "view" in kwargs:
+            kwargs = _check_view(locale, count, variables, **kwargs)
 
         if isinstance(self, discord.Webhook):
             return await edit_func(self, message_id, **kwargs)
@@ -282,19 +366,25 @@ async def _localize_modal(
 ):
     locale = I18N.get_locale(self)
     variables, kwargs = _extract_parameters(INTERACTION_MODAL, **kwargs)
+    variables = _format_variables(locale, variables)
     modal_name = modal.__class__.__name__
+    location = I18N.get_location()
 
-    modal.title = I18N.load_text(modal.title, locale, count, modal_name, **variables)
+    modal.title = I18N._load_text(modal.title, locale, count, modal_name, (), location, variables)
 
     for child in modal.children:
-        child.label = I18N.load_text(child.label, locale, count, modal_name, **variables)
+        child.label = I18N._load_text(
+            child.label, locale, count, modal_name, (), location, variables
+        )
 
         if hasattr(child, "placeholder"):
-            child.placeholder = I18N.load_text(
-                child.placeholder, locale, count, modal_name, **variables
+            child.placeholder = I18N._load_text(
+                child.placeholder, locale, count, modal_name, (), location, variables
             )
         if hasattr(child, "value"):
-            child.value = I18N.load_text(child.value, locale, count, modal_name, **variables)
+            child.value = I18N._load_text(
+                child.value, locale, count, modal_name, (), location, variables
+            )
 
     return await INTERACTION_MODAL(self, modal)
 
@@ -309,6 +399,11 @@ class I18N:
         Methods in this class are called automatically and do not need to be
         called manually in most cases.
 
+    .. note::
+        Locales are processed when they are used for the first time. Until then,
+        :attr:`localizations` contains the unprocessed values of a locale, including
+        general variables. Use :meth:`get_localizations` to get the processed values.
+
     Parameters
     ----------
     localizations:
@@ -336,6 +431,8 @@ class I18N:
         The log level in :meth:`ezcord.logs.set_log` must be set to ``DEBUG`` for this to work.
     debug:
         Whether to send debug messages and warnings. Defaults to ``True``.
+
+        This checks the keys of all locales when the class is initialized.
     language_settings:
         A function to set custom language settings. The function must return a dictionary
         with user/guild IDs as keys and the locale as values. Defaults to ``None``.
@@ -345,14 +442,22 @@ class I18N:
     """
 
     localizations: dict[str, dict]
+    _flat_localizations: dict[str, dict[tuple, Any]] = {}  # key paths of all loaded locales
+    _key_names: dict[str, frozenset] = {}  # names of all keys per loaded locale
     fallback_locale: str
+    process_strings: bool
+    _variables: dict  # additional general variables
+    _shared_strings: dict[str, str] = {}  # strings of all loaded locales
     prefer_user_locale: bool = False
     localize_numbers: bool
     ignore_discord_ids: bool
     exclude_methods: list[str] | None
+    # Methods that are ignored by get_location. "sub" is used for regex substitution
+    # when searching for keys within other keys.
+    _skip_methods: frozenset[str] = frozenset(("respond", "sub"))
 
-    _general_values: dict = {}  # general values for the current localization
-    _current_general: dict = {}  # general values for the current group
+    _locales: dict[str, str] = {}  # interned names of all available locales
+    _clean_locales: dict[str, str] = {}  # locales without the region, e.g. "en-US" -> "en"
 
     cmd_localizations: dict[str, dict] = {}  # set through bot.localize_commands
     initialized: bool = False
@@ -398,18 +503,22 @@ class I18N:
         if fallback_locale == "en":
             fallback_locale = "en-US"
 
-        if process_strings:
-            I18N.localizations = self._process_strings(localizations, **variables)
-        else:
-            I18N.localizations = localizations
+        # locales are processed when they are used for the first time
+        I18N.localizations = localizations
+        I18N.process_strings = process_strings
+        I18N._variables = variables
+        I18N.fallback_locale = _intern(fallback_locale)
+        I18N.clear_cache()
 
-        I18N.fallback_locale = fallback_locale
+        if I18N.fallback_locale in localizations:
+            I18N._load_locale(I18N.fallback_locale)
         I18N.prefer_user_locale = prefer_user_locale
         I18N.localize_numbers = localize_numbers
         I18N.ignore_discord_ids = ignore_discord_ids
         if not exclude_methods:
             exclude_methods = []
         I18N.exclude_methods = exclude_methods
+        I18N._skip_methods = frozenset(("respond", "sub", *exclude_methods))
         I18N._custom_language_settings = language_settings
 
         if not disable_translations:
@@ -418,32 +527,93 @@ class I18N:
         if debug:
             I18N._check_localizations()
 
-        if "send" not in disable_translations:
-            setattr(discord.abc.Messageable, "send", _localize_send(MESSAGE_SEND))
-        if "edit" not in disable_translations:
-            setattr(discord.Message, "edit", _localize_edit(MESSAGE_EDIT))
-        if "reply" not in disable_translations:
-            setattr(discord.Message, "reply", _localize_send(MESSAGE_REPLY))
-
-        if "send_message" not in disable_translations:
-            setattr(discord.InteractionResponse, "send_message", _localize_send(INTERACTION_SEND))
-        if "send_modal" not in disable_translations:
-            setattr(discord.InteractionResponse, "send_modal", _localize_modal)
-        if "edit_message" not in disable_translations:
-            setattr(discord.InteractionResponse, "edit_message", _localize_edit(INTERACTION_EDIT))
-        if "edit_original_response" not in disable_translations:
-            setattr(
+        # option of disable_translations, class, attribute, original method, localization wrapper
+        hooks = (
+            ("send", discord.abc.Messageable, "send", MESSAGE_SEND, _localize_send),
+            ("edit", discord.Message, "edit", MESSAGE_EDIT, _localize_edit),
+            ("reply", discord.Message, "reply", MESSAGE_REPLY, _localize_send),
+            (
+                "send_message",
+                discord.InteractionResponse,
+                "send_message",
+                INTERACTION_SEND,
+                _localize_send,
+            ),
+            (
+                "send_modal",
+                discord.InteractionResponse,
+                "send_modal",
+                INTERACTION_MODAL,
+                lambda _: _localize_modal,
+            ),
+            (
+                "edit_message",
+                discord.InteractionResponse,
+                "edit_message",
+                INTERACTION_EDIT,
+                _localize_edit,
+            ),
+            (
+                "edit_original_response",
                 discord.Interaction,
                 "edit_original_response",
-                _localize_edit(INTERACTION_EDIT_ORIGINAL),
-            )
-        if "webhook_send" not in disable_translations:
-            setattr(discord.Webhook, "send", _localize_send(WEBHOOK_SEND))
-            setattr(discord.Interaction, "respond", _localize_send(INTERACTION_RESPOND))
-        if "webhook_edit_message" not in disable_translations:
-            setattr(discord.Webhook, "edit_message", _localize_edit(WEBHOOK_EDIT_MESSAGE))
-        if "webhook_edit_message" not in disable_translations:
-            setattr(discord.WebhookMessage, "edit_message", _localize_edit(WEBHOOK_EDIT))
+                INTERACTION_EDIT_ORIGINAL,
+                _localize_edit,
+            ),
+            ("webhook_send", discord.Webhook, "send", WEBHOOK_SEND, _localize_send),
+            ("webhook_send", discord.Interaction, "respond", INTERACTION_RESPOND, _localize_send),
+            (
+                "webhook_edit_message",
+                discord.Webhook,
+                "edit_message",
+                WEBHOOK_EDIT_MESSAGE,
+                _localize_edit,
+            ),
+            (
+                "webhook_edit_message",
+                discord.WebhookMessage,
+                "edit_message",
+                WEBHOOK_EDIT,
+                _localize_edit,
+            ),
+        )
+        disabled = frozenset(disable_translations)
+        for option, cls, attribute, original, localize in hooks:
+            # some methods don't exist in every library version
+            if option not in disabled and original is not None:
+                setattr(cls, attribute, localize(original))
+
+    @staticmethod
+    def clear_cache():
+        """Clear the loaded locales and the cache of localized strings.
+
+        This is done automatically when the class is initialized. Call this method if
+        :attr:`localizations` was modified afterwards. The locales are loaded again
+        when they are used for the next time.
+        """
+        # locales are interned, so that the locales returned by get_locale are always the same
+        # objects as the locales in the caches
+        I18N._locales = {locale: _intern(locale) for locale in I18N.localizations}
+        I18N._clean_locales = {
+            locale: locale.split("-")[0] for locale in [*I18N.localizations, I18N.fallback_locale]
+        }
+        I18N._flat_localizations = {}
+        I18N._key_names = {}
+        I18N._shared_strings = {}
+        _LANGUAGE_TEMPLATES.clear()
+        _TEXT_CACHE.clear()
+
+    @staticmethod
+    def get_localizations(locale: str) -> dict:
+        """Returns the values of the given locale with all general variables replaced.
+
+        Parameters
+        ----------
+        locale:
+            The locale to get the values for.
+        """
+        I18N._get_localizations(locale)  # process the locale if it was not used yet
+        return I18N.localizations[locale]
 
     @staticmethod
     def get_locale(obj: LOCALE) -> str:
@@ -458,8 +628,8 @@ class I18N:
         """
 
         if isinstance(obj, str):
-            if hasattr(I18N, "localizations") and obj not in I18N.localizations:
-                return I18N.fallback_locale
+            if hasattr(I18N, "localizations"):
+                return I18N._locales.get(obj, I18N.fallback_locale)
             return obj
 
         guild_id, user_id = None, None
@@ -485,11 +655,7 @@ class I18N:
             locale = obj.preferred_locale
             guild_id = obj.id
 
-        elif (
-            isinstance(obj, discord.abc.Messageable | discord.Message)
-            and hasattr(obj, "guild")
-            and obj.guild
-        ):
+        elif isinstance(obj, _MESSAGE_TYPES) and hasattr(obj, "guild") and obj.guild:
             locale = obj.guild.preferred_locale
             guild_id = obj.guild.id
 
@@ -517,9 +683,7 @@ class I18N:
 
         # check if the locale is available. if not, use the fallback locale
         if hasattr(I18N, "localizations"):
-            if locale not in I18N.localizations:
-                return I18N.fallback_locale
-            return locale
+            return I18N._locales.get(locale, I18N.fallback_locale)
 
         return locale  # I18N class is not in use
 
@@ -534,7 +698,7 @@ class I18N:
             The object to get the locale from.
         """
         locale = I18N.get_locale(obj)
-        return locale.split("-")[0]
+        return I18N._clean_locales.get(locale) or locale.split("-")[0]
 
     @staticmethod
     def get_location():
@@ -543,26 +707,27 @@ class I18N:
         This can only get the class if a method was executed from inside the class.
         """
 
-        inspect_stack = inspect.stack()
-
-        # Ignore the following internal sources to determine the origin method
-        # "sub" is used for regex substitution when searching for keys within other keys.
-        methods = ["respond", "sub"] + I18N.exclude_methods
-        files = ["i18n", "emb", "interactions"]
+        # Walk the frames directly, as inspect.stack() would also load the source code
+        # of every frame. The first two frames are this method and its caller.
+        frame = sys._getframe(1).f_back
 
         file, method, class_ = None, None, None
-        for i in inspect_stack[2:]:
-            if i.function not in methods and Path(i.filename).stem not in files:
-                try:
-                    class_ = i.frame.f_locals["self"].__class__.__name__
-                except KeyError:
-                    pass  # No class found
-                file = i.filename
-                method = i.function
+        while frame:
+            code = frame.f_code
+            stem = _FILE_STEMS.get(code.co_filename)
+            if stem is None:
+                stem = _FILE_STEMS[code.co_filename] = Path(code.co_filename).stem
+
+            if code.co_name not in I18N._skip_methods and stem not in _SKIP_FILES:
+                if "self" in code.co_varnames or "self" in code.co_freevars:
+                    try:
+                        class_ = frame.f_locals["self"].__class__.__name__
+                    except KeyError:
+                        pass  # No class found
+                file = stem
+                method = code.co_name
                 break
-
-        if file:
-            file = Path(file).stem
+            frame = frame.f_back
 
         return file, method, class_
 
@@ -575,71 +740,90 @@ class I18N:
         >>> I18N._replace_variables("Hello {name}", name="Timo")
         "Hello Timo"
         """
-        if not string:
+        if not string or not variables or "{" not in string:
+            return string  # nothing to replace
+
+        template = _compile_template(string)
+        if len(template) == 1:
             return string
 
-        for key, value in variables.items():
-            if I18N.localize_numbers and isinstance(value, int):
-                if not (I18N.ignore_discord_ids and len(str(value)) >= 17):
-                    value = f"{value:,}"
-                    if locale == "de":
-                        value = value.replace(",", ".")
-            string = string.replace("{" + key + "}", str(value))
+        localize_numbers = I18N.localize_numbers
+        parts = list(template)
+        for i in range(1, len(parts), 2):
+            key = parts[i]
+            if key not in variables:
+                parts[i] = "{" + key + "}"
+                continue
 
-        return string
+            value = variables[key]
+            if localize_numbers and type(value) is int:
+                value = _format_number(value, locale)
+            parts[i] = value if type(value) is str else str(value)
+
+        return "".join(parts)
 
     @staticmethod
-    def _get_text(
-        key: str, locale: str, count: int | None, called_class: str | None, add_locations: tuple
-    ) -> str:
-        """Looks for the specified key in different locations of the language file."""
+    def _find_text(
+        key: str,
+        locale: str,
+        count: int | None,
+        called_class: str | None,
+        add_locations: tuple,
+        location: tuple | None = None,
+    ) -> str | list | None:
+        """Looks for the specified key in different locations of the language file.
+        Used by :meth:`_load_text`.
+
+        Lists with multiple elements are returned without picking a random element.
+        Returns ``None`` if the key was not found.
+        """
 
-        file_name, method_name, class_name = I18N.get_location()
+        file_name, method_name, class_name = location or I18N.get_location()
 
-        lookups: list[list | tuple]
+        lookups: tuple[tuple, ...]
         if "." in key:
-            lookups = [key.split("."), [file_name] + key.split(".")]
+            path = tuple(key.split("."))
+            lookups = (path, (file_name, *path))
         else:
-            lookups = [
+            lookups = (
                 (file_name, method_name, key),
                 (file_name, called_class, key),
                 (file_name, class_name, key),
                 (file_name, "general", key),
                 ("general", key),
                 (file_name, key),
-            ]
-            for location in add_locations:
-                lookups.append((file_name, location, key))
+            )
+            if add_locations:
+                lookups += tuple((file_name, location, key) for location in add_locations)
 
-        localizations = I18N.localizations[locale]
+        localizations = I18N._get_localizations(locale)
 
         for lookup in lookups:
-            current_section = localizations.copy()
-            for location in lookup:
-                try:
-                    current_section = current_section.get(location, {})
-                except AttributeError:
-                    return key
-
-            txt = current_section
+            txt = localizations.get(lookup)
             if isinstance(txt, str):
                 return txt
             elif isinstance(txt, int):
                 return str(txt)
             elif isinstance(txt, list):
-                return random.choice(txt)
+                # lists with a single string don't need a random choice
+                return txt[0] if len(txt) == 1 else txt
             elif count is not None and isinstance(txt, dict):
                 # Load pluralization if available
-                if count == 0 and "zero" in txt:
-                    return txt["zero"]
-                elif count == 1 and "one" in txt:
-                    return txt["one"]
-                elif count > 1 and "many" in txt:
-                    return txt["many"]
-                elif str(count) in txt:
-                    return txt[str(count)]
-
-        return key
+                if count == 0:
+                    plural = txt.get("zero")
+                elif count == 1:
+                    plural = txt.get("one")
+                elif count > 1:
+                    plural = txt.get("many")
+                else:
+                    plural = None
+
+                if plural is None:
+                    plural = txt.get(str(count))
+                if plural is not None:
+                    return plural
+
+        return None
 
     @staticmethod
     def load_text(
@@ -665,36 +849,121 @@ class I18N:
         if key is None:
             return None
 
-        string = I18N._get_text(key, locale, count, called_class, add_locations)
+        if not I18N._is_key(key, locale):
+            return key  # most likely a static string, so the stack doesn't need to be inspected
+
+        return I18N._load_text(
+            key, locale, count, called_class, add_locations, I18N.get_location(), variables
+        )
+
+    @staticmethod
+    def _is_key(string: str, locale: str) -> bool:
+        """Checks if a string might be a key of the language file or contains variables.
+        If this returns ``False``, the string doesn't need to be localized.
+        """
+        if "{" in string:
+            return True
 
-        if count:
-            variables = {**variables, "count": count}
-        string = I18N._replace_variables(string, locale, **variables)
+        key_names = I18N._key_names.get(locale)
+        if key_names is None:
+            key_names = frozenset(path[-1] for path in I18N._get_localizations(locale))
+            I18N._key_names[locale] = key_names
 
-        def replace_keys(m: re.Match):
-            k = m.group(1)
-            check_key = I18N._get_text(k, locale, count, called_class, add_locations)
-            return check_key if check_key != k else m.group()
+        return string.rpartition(".")[2] in key_names
 
-        # check if key contains other keys
-        if "{" in string and "}" in string:
-            string = re.sub(r"{(.*?)}", replace_keys, string)
+    @staticmethod
+    def _load_text(
+        key: str,
+        locale: str,
+        count: int | None,
+        called_class: str | None,
+        add_locations: tuple,
+        location: tuple,
+        variables: dict,
+    ):
+        """Same as :meth:`load_text`, but uses a location that was already determined
+        by :meth:`get_location`. This avoids inspecting the stack for every string
+        if multiple strings are loaded at once.
+        """
 
-        return I18N._replace_variables(string, locale, **variables)
+        if key is None or not I18N._is_key(key, locale):
+            return key
+
+        cache_key = None
+        if all(type(value) in _CACHEABLE_TYPES for value in variables.values()):
+            cache_key = (
+                key,
+                locale,
+                count,
+                called_class,
+                add_locations,
+                location,
+                type(count),
+                # 1, 1.0 and True are equal, but they are formatted differently
+                tuple((name, type(value), value) for name, value in variables.items()),
+            )
+            cached = _TEXT_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # strings from lists are picked randomly, so they are never cached
+        is_random = False
+
+        string = I18N._find_text(key, locale, count, called_class, add_locations, location)
+        if string is None:
+            string = key
+        elif isinstance(string, list):
+            string = _RNG.choice(string)
+            is_random = True
+
+        # static strings don't need any replacements
+        if "{" in string:
+            if count:
+                variables = {**variables, "count": count}
+            string = I18N._replace_variables(string, locale, **variables)
+
+            def replace_keys(m: re.Match):
+                nonlocal is_random
+                k = m.group(1)
+                txt = I18N._find_text(k, locale, count, called_class, add_locations, location)
+                if isinstance(txt, list):
+                    is_random = True
+                    txt = _RNG.choice(txt)
+                return txt if txt is not None and txt != k else m.group()
+
+            # check if key contains other keys
+            if "{" in string and "}" in string:
+                string = re.sub(r"{(.*?)}", replace_keys, string)
+                string = I18N._replace_variables(string, locale, **variables)
+
+        if cache_key is not None and not is_random:
+            if len(_TEXT_CACHE) >= _TEXT_CACHE_SIZE:
+                _TEXT_CACHE.clear()
+            _TEXT_CACHE[cache_key] = string
+        return string
 
     @staticmethod
     def load_embed(embed: TEmbed, locale: str) -> discord.Embed:
         """Loads an embed from the language file."""
 
-        file_name, method_name, class_name = I18N.get_location()
+        return I18N._load_embed(embed, locale, I18N.get_location())
+
+    @staticmethod
+    def _load_embed(embed: TEmbed, locale: str, location: tuple) -> discord.Embed:
+        """Same as :meth:`load_embed`, but uses a location that was already determined
+        by :meth:`get_location`.
+        """
+
+        file_name, method_name, class_name = location
 
         # search not only the location of the embed usage,
         # but also the location of the embed creation
         original_method, original_class = embed.method_name, embed.class_name
 
-        lookups: list[list | tuple]
+        lookups: list[tuple]
         if "." in embed.key:
-            lookups = [embed.key.split("."), [file_name] + embed.key.split(".")]
+            path = tuple(embed.key.split("."))
+            lookups = [path, (file_name, *path)]
         else:
             lookups = [
                 (file_name, method_name, embed.key),
@@ -704,13 +973,10 @@ class I18N:
                 (file_name, embed.key),
             ]
 
-        localizations = I18N.localizations[locale]
+        localizations = I18N._get_localizations(locale)
 
         for lookup in lookups:
-            current_section = localizations.copy()
-            for location in lookup:
-                current_section = current_section.get(location, {})
-
+            current_section = localizations.get(lookup)
             if current_section:
                 t_embed_dict = embed.to_dict()
                 for key, value in current_section.items():
@@ -734,123 +1000,269 @@ class I18N:
         Does not modify the original content.
         """
 
+        return I18N._load_lang_keys(
+            content, locale, count, add_locations, I18N.get_location(), variables
+        )
+
+    @staticmethod
+    def _load_lang_keys(
+        content: dict | str,
+        locale: str,
+        count: int | None,
+        add_locations: tuple,
+        location: tuple,
+        variables: dict,
+    ) -> dict | str:
+        """Same as :meth:`load_lang_keys`, but uses a location that was already determined
+        by :meth:`get_location`, so that the stack is only inspected once per content.
+        """
+
         if isinstance(content, str):
-            return I18N.load_text(content, locale, count, add_locations=add_locations, **variables)
+            return I18N._load_text(content, locale, count, None, add_locations, location, variables)
 
-        content = deepcopy(content)
+        if not isinstance(content, dict):
+            return content
 
+        # build a new dict instead of copying the content, as all strings are replaced anyway
+        new_content = {}
         for key, value in content.items():
             if isinstance(value, str):
-                if key in ["color", "colour", "type", "url", "timestamp", "image", "thumbnail"]:
-                    continue
-
-                content[key] = I18N.load_text(
-                    value, locale, count, add_locations=add_locations, **variables
-                )
-            elif isinstance(value, list):
-                items = []
-                for element in value:
-                    items.append(
-                        I18N.load_lang_keys(element, locale, count, add_locations, **variables)
+                if key not in ["color", "colour", "type", "url", "timestamp", "image", "thumbnail"]:
+                    value = I18N._load_text(
+                        value, locale, count, None, add_locations, location, variables
                     )
-                content[key] = items
+            elif isinstance(value, list):
+                value = [
+                    I18N._load_lang_keys(element, locale, count, add_locations, location, variables)
+                    for element in value
+                ]
             elif isinstance(value, dict):
-                content[key] = I18N.load_lang_keys(value, locale, count, add_locations, **variables)
+                value = I18N._load_lang_keys(
+                    value, locale, count, add_locations, location, variables
+                )
+            new_content[key] = value
 
-        return content
+        return new_content
 
     @staticmethod
-    def _replace_general_variables(string: str) -> str:
-        """Replaces global and local general variables with their values."""
-
-        def replace_local(match: re.Match):
-            match = match.group().replace("{.", "").replace("}", "")
-            if match in I18N._current_general:
-                return I18N._current_general[match]
-
-            if match in I18N._general_values:
-                return I18N._general_values[match]
+    def _replace_general_variables(
+        string: str, general_values: Mapping, current_general: Mapping
+    ) -> str:
+        """Replaces global and local general variables with their values.
 
-            return match
+        Parameters
+        ----------
+        string:
+            The string to replace the variables in.
+        general_values:
+            The general values for the current localization.
+        current_general:
+            The general values for the current group.
+        """
 
-        def replace_global(possible_match: re.Match) -> str:
-            match = possible_match.group()
-            clean_match = match.replace("{", "").replace("}", "")
-            if clean_match in I18N._general_values:
-                if type(I18N._general_values[clean_match]) is str:
-                    return I18N._general_values[clean_match]
+        def replace(match: re.Match) -> str:
+            is_local, name = match.groups()
+            if is_local:
+                # local variables can also be loaded from the global general values
+                for values in (current_general, general_values):
+                    if isinstance(values.get(name), str):
+                        return values[name]
+                return name
 
-            return str(match)
+            if isinstance(general_values.get(name), str):
+                return general_values[name]
+            return match.group()
 
-        string = re.sub(r"{\..*?}", replace_local, string)
-        string = re.sub(r"{.*?}", replace_global, string)
-        return string
+        return _GENERAL_VARIABLE_PATTERN.sub(replace, string)
 
     @staticmethod
-    def _replace_dict(content: dict | str) -> dict | str:
+    def _replace_dict(content: dict | list | str, general_values: Mapping) -> dict | list | str:
         """Iterates through the content and replaces all general variables with their values.
+        Dicts and lists are modified in place.
 
         This is only needed once when loading the language file.
         """
-        if isinstance(content, dict) and "general" in content:
-            I18N._current_general = content["general"]
-
         if isinstance(content, str):
-            return I18N._replace_general_variables(content)
+            return I18N._replace_general_variables(content, general_values, {})
 
-        for key, value in content.items():
-            if isinstance(value, str):
-                content[key] = I18N._replace_general_variables(value)
-            if isinstance(value, list):
-                items = []
-                for element in value:
-                    items.append(I18N._replace_dict(element))
-                content[key] = items
-            elif isinstance(value, dict):
-                content[key] = I18N._replace_dict(value)
+        # Each entry contains a dict or list, the iterator over its items and the general
+        # values of the closest "general" section
+        stack: list[tuple[dict | list, Iterator, dict]] = []
+
+        def add(node: dict | list, general: dict):
+            if isinstance(node, dict):
+                if isinstance(node.get("general"), dict):
+                    general = node["general"]
+                stack.append((node, iter(node.items()), general))
+            else:
+                stack.append((node, enumerate(node), general))
+
+        # Identical strings are common in language files, so they are only replaced once
+        # for the same general section
+        replaced: dict[tuple[str, int], str] = {}
+
+        add(content, {})
+        while stack:
+            node, items, general = stack[-1]
+            for key, value in items:
+                if isinstance(value, str):
+                    if "{" not in value:
+                        continue  # no variables to replace
+
+                    cache_key = (value, id(general))
+                    if cache_key not in replaced:
+                        replaced[cache_key] = I18N._replace_general_variables(
+                            value, general_values, general
+                        )
+                    node[key] = replaced[cache_key]
+                elif isinstance(value, (dict, list)):
+                    add(value, general)
+                    break
+            else:
+                stack.pop()
 
         return content
 
     @staticmethod
-    def _process_strings(localizations: dict, **variables) -> dict:
-        """Process all strings and replace general variables when loading the language file.
+    def _process_strings(values: dict, **variables) -> dict:
+        """Process all strings of a locale and replace general variables when loading
+        the language file.
 
         A general variable is defined in one of the "general" sections of the language files.
         """
-        new_dict = {}
-        for locale, values in localizations.items():
-            if "general" in values:
-                I18N._general_values = {**values["general"], **variables}
+        general_values: Mapping
+        if "general" in values:
+            # variables take precedence over the general section of the language file
+            general_values = ChainMap(variables, values["general"])
+        else:
+            general_values = variables
+
+        I18N._replace_dict(values, general_values)
+        return values
+
+    @staticmethod
+    def _get_localizations(locale: str) -> dict[tuple, Any]:
+        """Returns the flattened localizations of the given locale and loads the locale
+        if it's used for the first time.
+        """
+        localizations = I18N._flat_localizations.get(locale)
+        if localizations is None:
+            localizations = I18N._load_locale(locale)
+        return localizations
+
+    @staticmethod
+    def _load_locale(locale: str) -> dict[tuple, Any]:
+        """Processes the strings of a locale, flattens it and compiles its templates.
+
+        Locales that share the same values (e.g. "en") are loaded together.
+        """
+        values = I18N.localizations[locale]
+        if I18N.process_strings:
+            I18N._process_strings(values, **I18N._variables)
+
+        flat = I18N._flatten(values)
+        I18N._share_strings(values, flat)
+        I18N._compile_templates(flat)
+
+        for other_locale, other_values in I18N.localizations.items():
+            if other_values is values:
+                I18N._flat_localizations[_intern(other_locale)] = flat
+
+        return flat
+
+    @staticmethod
+    def _flatten(values: dict) -> dict[tuple, Any]:
+        """Maps the path of every key in the language file to its value, e.g.
+        ``{"cog": {"cmd": "text"}}`` to ``{("cog",): {"cmd": "text"}, ("cog", "cmd"): "text"}``.
+
+        This is only needed once when loading the language file, so that a key can be
+        loaded with a single lookup instead of walking through all sections.
+        """
+        flat: dict[tuple, Any] = {}
+        stack: list[tuple[tuple, Iterator]] = [((), iter(values.items()))]
+        while stack:
+            path, items = stack[-1]
+            for key, value in items:
+                # keys repeat in every locale, so all paths share the same strings
+                key_path = path + (_intern(key),)
+                flat[key_path] = value
+                if isinstance(value, dict):
+                    stack.append((key_path, iter(value.items())))
+                    break
             else:
-                I18N._general_values = variables
+                stack.pop()
+
+        return flat
 
-            new_dict[locale] = I18N._replace_dict(values)
+    @staticmethod
+    def _share_strings(values: dict, flat: dict[tuple, Any]):
+        """Replaces strings that are equal to a string of an already loaded locale
+        with that string, so that equal values of all locales share the same object.
+        """
+        for path, value in flat.items():
+            if not isinstance(value, str):
+                continue
+
+            shared = I18N._shared_strings.get(value)
+            if shared is None:
+                # short strings are also interned, so they share the object of equal keys
+                # and string literals, which makes comparisons in the caches cheaper
+                shared = _intern(value) if len(value) <= _INTERN_MAX_LENGTH else value
+                I18N._shared_strings[value] = shared
+            if shared is not value:
+                parent = flat[path[:-1]] if len(path) > 1 else values
+                parent[path[-1]] = flat[path] = shared
 
-        return new_dict
+    @staticmethod
+    def _compile_templates(values: dict[tuple, Any]):
+        """Compiles all strings with variables in the flattened language file,
+        so that they don't need to be parsed when they are used for the first time.
+        """
+        for value in values.values():
+            strings = value if isinstance(value, list) else (value,)
+            for string in strings:
+                if isinstance(string, str) and "{" in string:
+                    _LANGUAGE_TEMPLATES[string] = _TEMPLATE_CACHE[string] = tuple(
+                        _VARIABLE_PATTERN.split(string)
+                    )
 
     @staticmethod
-    def _find_missing_keys(fallback: dict, current_locale: dict):
-        """Find keys and sub-keys that are missing in the current locale."""
+    def _find_missing_keys(fallback: dict[tuple, Any], current_locale: dict[tuple, Any]):
+        """Find keys and sub-keys that are missing in the current locale.
 
-        missing_keys = []
+        Both locales must be flattened with :meth:`_flatten`. Keys inside a section that is
+        missing as a whole are not listed separately.
+        """
 
-        def explore_dict(original: dict, current: dict, path: str):
-            for key, value in original.items():
-                if key not in current:
-                    missing_keys.append(f"{path}.{key}".lstrip("."))
-                elif isinstance(value, dict) and isinstance(current.get(key), dict):
-                    explore_dict(value, current[key], f"{path}.{key}")
+        missing = fallback.keys() - current_locale.keys()
+        if not missing:
+            return []
 
-        explore_dict(fallback, current_locale, "")
-        return missing_keys
+        return [
+            ".".join(map(str, path))
+            for path in fallback
+            if path in missing
+            and (len(path) == 1 or isinstance(current_locale.get(path[:-1]), dict))
+        ]
 
     @staticmethod
     def _check_localizations():
         """Checks if all locales have the same keys."""
 
-        for locale, values in I18N.localizations.items():
-            missing_keys = I18N._find_missing_keys(I18N.localizations[I18N.fallback_locale], values)
+        # keys don't change when a locale is processed, so unused locales are not loaded here
+        flat_keys = {
+            locale: I18N._flat_localizations.get(locale) or I18N._flatten(values)
+            for locale, values in I18N.localizations.items()
+        }
+        fallback = flat_keys[I18N.fallback_locale]
+        for locale, values in flat_keys.items():
+            if values is fallback:
+                continue  # the fallback locale itself or a locale sharing its values
+
+            missing_keys = I18N._find_missing_keys(fallback, values)
             if len(missing_keys) > 0:
-                log.warn(
-                    f"Locale '{locale}' misses some keys from the fallback locale: {missing_keys}"
+                log.warning(
+                    "Locale '%s' misses some keys from the fallback locale: %s",
+                    locale,
+                    missing_keys,
                 )
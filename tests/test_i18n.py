@@ -0,0 +1,285 @@
+from ezcord import i18n
+from ezcord.i18n import I18N, _format_variables
+
+
+def test_replace_variables(monkeypatch):
+    monkeypatch.setattr(I18N, "localize_numbers", True, raising=False)
+    monkeypatch.setattr(I18N, "ignore_discord_ids", True, raising=False)
+
+    assert I18N._replace_variables("Hello {name}", "en-US", name="Timo") == "Hello Timo"
+    assert I18N._replace_variables("{a} {b} {a}", "en-US", a=1, b="x") == "1 x 1"
+    assert I18N._replace_variables("{unknown} {name}", "en-US", name="x") == "{unknown} x"
+    assert I18N._replace_variables("No variables", "en-US", name="x") == "No variables"
+    assert I18N._replace_variables("", "en-US", name="x") == ""
+    assert I18N._replace_variables("Hello {name}", "en-US") == "Hello {name}"
+
+    # localized numbers
+    assert I18N._replace_variables("{n}", "en-US", n=1234567) == "1,234,567"
+    assert I18N._replace_variables("{n}", "de", n=1234567) == "1.234.567"
+    assert I18N._replace_variables("{n}", "en-US", n=123456789012345678) == "123456789012345678"
+    assert I18N._replace_variables("{n}", "en-US", n=10**16 - 1) == "9,999,999,999,999,999"
+    assert I18N._replace_variables("{n}", "en-US", n=True) == "True"
+
+
+def test_format_variables(monkeypatch):
+    monkeypatch.setattr(I18N, "localize_numbers", True, raising=False)
+    monkeypatch.setattr(I18N, "ignore_discord_ids", True, raising=False)
+
+    variables = {"n": 1234, "id": 123456789012345678, "count": 1000, "name": "x"}
+    assert _format_variables("de", variables) == {
+        "n": "1.234",
+        "id": 123456789012345678,
+        "count": 1000,
+        "name": "x",
+    }
+
+    monkeypatch.setattr(I18N, "localize_numbers", False)
+    assert _format_variables("de", variables) is variables
+
+
+def test_flatten():
+    values = {"general": {"accept": "Accept"}, "cog": {"cmd": {"text": "Hi", "items": ["a"]}}}
+    flat = I18N._flatten(values)
+
+    assert flat[("general", "accept")] == "Accept"
+    assert flat[("cog", "cmd", "text")] == "Hi"
+    assert flat[("cog", "cmd", "items")] == ["a"]
+    assert flat[("cog", "cmd")] is values["cog"]["cmd"]
+    assert list(flat) == [
+        ("general",),
+        ("general", "accept"),
+        ("cog",),
+        ("cog", "cmd"),
+        ("cog", "cmd", "text"),
+        ("cog", "cmd", "items"),
+    ]
+
+
+def test_find_missing_keys():
+    fallback = {"general": {"a": "A", "b": "B"}, "cog": {"cmd": {"text": "Hi"}}, "other": "x"}
+    current = {"general": {"a": "A"}, "cog": "not a section"}
+
+    missing = I18N._find_missing_keys(I18N._flatten(fallback), I18N._flatten(current))
+    assert missing == ["general.b", "other"]
+    assert I18N._find_missing_keys(I18N._flatten(fallback), I18N._flatten(fallback)) == []
+
+
+def test_replace_general_variables():
+    general = {"accept": "Accept", "cookie": {"one": "Cookie"}}
+    local = {"example": "example"}
+
+    def replace(string):
+        return I18N._replace_general_variables(string, general, local)
+
+    assert replace("{accept} the {.example}?") == "Accept the example?"
+    assert replace("{.accept}") == "Accept"
+    assert replace("{.missing} {missing} {user}") == "missing {missing} {user}"
+    assert replace("{cookie}") == "{cookie}"
+    assert replace("{text {.example}}") == "{text example}"
+
+
+def test_load_text_cache(monkeypatch):
+    values = {"cog": {"cmd": {"text": "Hi {user}", "random": ["a", "b", "c", "d"]}}}
+    monkeypatch.setattr(I18N, "localizations", {"en-US": values}, raising=False)
+    monkeypatch.setattr(I18N, "process_strings", False, raising=False)
+    monkeypatch.setattr(I18N, "_flat_localizations", {})
+    monkeypatch.setattr(I18N, "_key_names", {})
+    monkeypatch.setattr(I18N, "_shared_strings", {})
+    monkeypatch.setattr(I18N, "_locales", {})
+    monkeypatch.setattr(I18N, "_clean_locales", {})
+    monkeypatch.setattr(I18N, "fallback_locale", "en-US", raising=False)
+    monkeypatch.setattr(I18N, "localize_numbers", True, raising=False)
+    monkeypatch.setattr(I18N, "ignore_discord_ids", True, raising=False)
+    I18N.clear_cache()
+
+    def load(key, **variables):
+        return I18N._load_text(key, "en-US", None, None, (), ("cog", "cmd", None), variables)
+
+    assert load("text", user="Timo") == "Hi Timo"
+
+    # modified localizations are used after clearing the cache
+    values["cog"]["cmd"]["text"] = "changed"
+    values["cog"]["cmd"]["new"] = "new text"
+    assert load("text", user="Timo") == "Hi Timo"
+    I18N.clear_cache()
+    assert load("text", user="Timo") == "changed"
+    assert load("new") == "new text"
+    assert load("Not a key", user="Timo") == "Not a key"
+
+    # equal values of different types are cached separately
+    assert load("{v}", v=1000) == "1,000"
+    assert load("{v}", v=1000.0) == "1000.0"
+    assert load("{v}", v=1) == "1"
+    assert load("{v}", v=True) == "True"
+
+    # random strings are not cached
+    results = {load("random") for _ in range(50)}
+    assert len(results) > 1
+
+
+def test_clear_cache_locales(monkeypatch):
+    localizations = {"en-US": {}}
+    monkeypatch.setattr(I18N, "localizations", localizations, raising=False)
+    monkeypatch.setattr(I18N, "fallback_locale", "en-US", raising=False)
+    monkeypatch.setattr(I18N, "_locales", {})
+    monkeypatch.setattr(I18N, "_clean_locales", {})
+    I18N.clear_cache()
+    assert I18N.get_locale("de") == "en-US"
+
+    # locales that were added afterwards are available after clearing the cache
+    localizations["de"] = {}
+    I18N.clear_cache()
+    assert I18N.get_locale("de") == "de"
+    assert I18N.get_clean_locale("de") == "de"
+
+
+def _location():
+    """Calls get_location like the I18N methods that load a text."""
+    return I18N.get_location()
+
+
+class _Cog:
+    def cmd(self):
+        return _location()
+
+    def nested(self):
+        def callback():
+            return self, _location()
+
+        return callback()[1]
+
+    def nested_without_self(self):
+        def callback():
+            return _location()
+
+        return callback()
+
+
+def test_get_location(monkeypatch):
+    cog = _Cog()
+    assert cog.cmd() == ("test_i18n", "cmd", "_Cog")
+    assert cog.nested() == ("test_i18n", "callback", "_Cog")
+    assert cog.nested_without_self() == ("test_i18n", "callback", None)
+
+    # excluded methods are skipped
+    monkeypatch.setattr(I18N, "_skip_methods", frozenset(("respond", "sub", "cmd")))
+    assert cog.cmd() == ("test_i18n", "test_get_location", None)
+
+
+def test_check_embeds_without_content(monkeypatch):
+    class EmptyEmbed:
+        """Like discord.Embed, an embed without content (e.g. a TEmbed) is falsy."""
+
+        def __bool__(self):
+            return False
+
+    localized = []
+
+    def localize_embed(embed, locale, count, variables, location):
+        localized.append(embed)
+        return "localized"
+
+    monkeypatch.setattr(i18n, "_localize_embed", localize_embed)
+
+    embed = EmptyEmbed()
+    kwargs = i18n._check_embeds("en-US", None, {}, embed=embed, embeds=[embed])
+    assert kwargs == {"embed": "localized", "embeds": ["localized"]}
+    assert localized == [embed, embed]
+
+
+def test_check_embeds_missing(monkeypatch):
+    def localize_embed(*args):
+        raise AssertionError("missing embeds must not be localized")
+
+    monkeypatch.setattr(i18n, "_localize_embed", localize_embed)
+
+    missing = i18n._DISCORD_MISSING
+    kwargs = i18n._check_embeds("en-US", None, {}, embed=missing, embeds=missing)
+    assert kwargs["embed"] is missing and kwargs["embeds"] is missing
+    assert i18n._check_embeds("en-US", None, {}, embed=None) == {"embed": None}
+
+
+class _Embed:
+    def to_dict(self):
+        return {"description": "text"}
+
+
+class _TEmbed(_Embed):
+    def __init__(self, variables):
+        self.variables = variables
+        self.method_name = "method"
+        self.class_name = "Class"
+
+
+def test_check_embeds_mixed(monkeypatch):
+    loaded = []
+
+    def load_lang_keys(content, locale, count, add_locations, location, variables):
+        loaded.append((count, add_locations, variables))
+        return content
+
+    monkeypatch.setattr(i18n, "TEmbed", _TEmbed)
+    monkeypatch.setattr(I18N, "_load_embed", lambda embed, locale, location: embed)
+    monkeypatch.setattr(I18N, "_load_lang_keys", load_lang_keys)
+
+    embeds = [_TEmbed({"user": "Timo", "count": 2}), _Embed()]
+    kwargs = i18n._check_embeds("en-US", 1, {}, embeds=embeds)
+    assert kwargs["embeds"] == embeds
+
+    # the variables, count and locations of a TEmbed are not used for the following embeds
+    assert loaded == [
+        (2, ("method", "Class"), {"user": "Timo", "count": 2}),
+        (1, (), {}),
+    ]
+
+
+class _Button:
+    def __init__(self, label):
+        self.label = label
+
+
+class _CustomButton(_Button):
+    pass
+
+
+class _View:
+    def __init__(self, *children):
+        self.children = children
+
+
+def test_check_view_custom_items(monkeypatch):
+    loaded = []
+
+    def load_text(content, locale, count, called_class, add_locations, location, variables):
+        loaded.append((content, called_class))
+        return content
+
+    monkeypatch.setattr(i18n, "_STANDARD_UI", (_Button,))
+    monkeypatch.setattr(i18n, "_VIEW_ITEM_ATTRIBUTES", {})
+    monkeypatch.setattr(I18N, "_load_text", load_text)
+
+    view = _View(_CustomButton("custom"), _Button("standard"))
+    i18n._check_view("en-US", None, {}, view=view)
+
+    # standard items after a custom item are searched in the view class
+    assert loaded == [("custom", "_CustomButton"), ("standard", "_View")]
+
+
+class _YamlString(str):
+    """A str subclass, like the scalar strings of ruamel.yaml."""
+
+
+def test_share_strings_subclass(monkeypatch):
+    monkeypatch.setattr(I18N, "_shared_strings", {})
+    text = _YamlString("short text")
+    values = {"cog": {"cmd": {"text": text, "other": "short text"}}}
+    flat = I18N._flatten(values)
+    I18N._share_strings(values, flat)
+
+    assert flat[("cog", "cmd", "text")] is text
+    assert values["cog"]["cmd"]["other"] is text
+
+
+def test_flatten_subclass_keys():
+    values = {_YamlString("cog"): {_YamlString("cmd"): "text"}}
+    assert I18N._flatten(values)[("cog", "cmd")] == "text"